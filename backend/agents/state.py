@@ -5,8 +5,13 @@ Manages session state, media events, vision inputs, memory context, and error tr
 
 from typing import TypedDict, List, Dict, Any, Optional, Literal
 from datetime import datetime
+import os
 import uuid
 
+# Bounded history sizes; the oldest entries are trimmed in place as new ones arrive
+MAX_MEDIA_EVENTS = 100
+MAX_VISION_INPUTS = 10
+
 
 class MediaEvent(TypedDict):
     """Individual media event in the processing pipeline."""
@@ -135,6 +140,11 @@ def create_initial_state(session_id: Optional[str] = None) -> AgentState:
     )
 
 
+def _new_event_id() -> str:
+    """Generate a random 128-bit hex id for high-frequency media records."""
+    return os.urandom(16).hex()
+
+
 def update_error_state(state: AgentState, error: str, operation: str) -> AgentState:
     """Update error state with new error information."""
     now = datetime.utcnow()
@@ -177,7 +187,7 @@ def add_media_event(state: AgentState, event_type: str, data: Dict[str, Any],
                    processing_time_ms: Optional[int] = None) -> AgentState:
     """Add a new media event to the state."""
     event = MediaEvent(
-        event_id=str(uuid.uuid4()),
+        event_id=_new_event_id(),
         timestamp=datetime.utcnow(),
         event_type=event_type,  # type: ignore
         data=data,
@@ -186,9 +196,9 @@ def add_media_event(state: AgentState, event_type: str, data: Dict[str, Any],
     
     state["media_events"].append(event)
     
-    # Keep only last 100 events to prevent memory bloat
-    if len(state["media_events"]) > 100:
-        state["media_events"] = state["media_events"][-100:]
+    # Trim in place rather than re-slicing, so a full history doesn't allocate a new list per event
+    if len(state["media_events"]) > MAX_MEDIA_EVENTS:
+        del state["media_events"][:-MAX_MEDIA_EVENTS]
     
     return state
 
@@ -200,7 +210,7 @@ def add_vision_input(state: AgentState, content_type: str, data: bytes,
         state["vision_inputs"] = []
     
     vision_input = VisionInput(
-        input_id=str(uuid.uuid4()),
+        input_id=_new_event_id(),
         timestamp=datetime.utcnow(),
         content_type=content_type,
         data=data,
@@ -210,9 +220,9 @@ def add_vision_input(state: AgentState, content_type: str, data: bytes,
     
     state["vision_inputs"].append(vision_input)
     
-    # Keep only last 10 vision inputs
-    if len(state["vision_inputs"]) > 10:
-        state["vision_inputs"] = state["vision_inputs"][-10:]
+    # Keep only the last MAX_VISION_INPUTS inputs
+    if len(state["vision_inputs"]) > MAX_VISION_INPUTS:
+        del state["vision_inputs"][:-MAX_VISION_INPUTS]
     
     return state
 
@@ -2,33 +2,39 @@
 Tests for the LangGraph agent graph implementation.
 """
 
+import copy
+
 import pytest
-from unittest.mock import Mock, AsyncMock, patch
-from datetime import datetime
+from unittest.mock import Mock, patch
 
 from agents.graph import AgentGraph
-from agents.state import create_initial_state, AgentState
-from langchain_core.messages import HumanMessage, AIMessage
+from agents.state import create_initial_state, update_error_state
+from langchain_core.messages import HumanMessage
+
+
+MOCK_CONFIG = {
+    "LIVEKIT_URL": "ws://test-livekit",
+    "LIVEKIT_API_KEY": "test-key",
+    "LIVEKIT_API_SECRET": "test-secret",
+    "DEEPGRAM_API_KEY": "test-deepgram",
+    "ELEVENLABS_API_KEY": "test-elevenlabs",
+    "ENABLE_VISION": True,
+    "ENABLE_TELEPHONY": False,
+    "MEM0_PROJECT": "test-project",
+}
+
+INITIAL_STATE_TEMPLATE = create_initial_state("test-session")
 
 
 @pytest.fixture
 def mock_config():
     """Mock configuration for testing."""
-    return {
-        "LIVEKIT_URL": "ws://test-livekit",
-        "LIVEKIT_API_KEY": "test-key",
-        "LIVEKIT_API_SECRET": "test-secret",
-        "DEEPGRAM_API_KEY": "test-deepgram",
-        "ELEVENLABS_API_KEY": "test-elevenlabs",
-        "ENABLE_VISION": True,
-        "ENABLE_TELEPHONY": False,
-        "MEM0_PROJECT": "test-project",
-    }
+    return dict(MOCK_CONFIG)
 
 
-@pytest.fixture
-def agent_graph(mock_config):
-    """Create agent graph instance for testing."""
+@pytest.fixture(scope="module", autouse=True)
+def mock_graph_tools():
+    """Replace the graph's tool clients with mocks once for the whole module."""
     with patch.multiple(
         'agents.graph',
         LiveKitManager=Mock,
@@ -37,13 +43,54 @@ def agent_graph(mock_config):
         Mem0Memory=Mock,
         VisionProcessor=Mock
     ):
-        return AgentGraph(mock_config)
+        yield
+
+
+@pytest.fixture(scope="module")
+def shared_agent_graph(mock_graph_tools):
+    """Build the agent graph once for the whole module."""
+    return AgentGraph(dict(MOCK_CONFIG))
+
+
+@pytest.fixture
+def agent_graph(shared_agent_graph):
+    """Provide the shared agent graph, resetting its tool mocks after each test."""
+    yield shared_agent_graph
+    
+    for tool in (
+        shared_agent_graph.livekit_manager,
+        shared_agent_graph.stt,
+        shared_agent_graph.tts,
+        shared_agent_graph.memory,
+        shared_agent_graph.vision,
+    ):
+        tool.reset_mock()
 
 
 @pytest.fixture
 def initial_state():
     """Create initial state for testing."""
-    return create_initial_state("test-session")
+    return copy.deepcopy(INITIAL_STATE_TEMPLATE)
+
+
+def _build_degraded_state(error_count):
+    """Build a state that has already recorded the given number of errors."""
+    state = copy.deepcopy(INITIAL_STATE_TEMPLATE)
+    for i in range(error_count):
+        state = update_error_state(state, f"Error {i}", "test")
+    return state
+
+
+@pytest.fixture(scope="module")
+def voice_only_state():
+    """State degraded to voice_only after four errors (read-only)."""
+    return _build_degraded_state(4)
+
+
+@pytest.fixture(scope="module")
+def error_limit_state():
+    """State past the conversation error limit after twelve errors (read-only)."""
+    return _build_degraded_state(12)
 
 
 class TestAgentGraph:
@@ -51,39 +98,23 @@ class TestAgentGraph:
     
     def test_graph_initialization(self, mock_config):
         """Test that the graph initializes correctly."""
-        with patch.multiple(
-            'agents.graph',
-            LiveKitManager=Mock,
-            DeepgramSTT=Mock,
-            ElevenLabsTTS=Mock,
-            Mem0Memory=Mock,
-            VisionProcessor=Mock
-        ):
-            graph = AgentGraph(mock_config)
-            
-            assert graph.config == mock_config
-            assert graph.graph is not None
-            assert graph.livekit_manager is not None
-            assert graph.stt is not None
-            assert graph.tts is not None
-            assert graph.memory is not None
-            assert graph.vision is not None
+        graph = AgentGraph(mock_config)
+        
+        assert graph.config == mock_config
+        assert graph.graph is not None
+        assert graph.livekit_manager is not None
+        assert graph.stt is not None
+        assert graph.tts is not None
+        assert graph.memory is not None
+        assert graph.vision is not None
     
     def test_graph_initialization_without_vision(self, mock_config):
         """Test graph initialization when vision is disabled."""
         mock_config["ENABLE_VISION"] = False
         
-        with patch.multiple(
-            'agents.graph',
-            LiveKitManager=Mock,
-            DeepgramSTT=Mock,
-            ElevenLabsTTS=Mock,
-            Mem0Memory=Mock,
-            VisionProcessor=Mock
-        ):
-            graph = AgentGraph(mock_config)
-            
-            assert graph.vision is None
+        graph = AgentGraph(mock_config)
+        
+        assert graph.vision is None
     
     @pytest.mark.asyncio
     async def test_supervisor_node_basic(self, agent_graph, initial_state):
@@ -213,53 +244,31 @@ class TestAgentGraph:
         result = agent_graph._validate_environment()
         assert result in ["healthy", "warning", "critical"]
     
-    def test_determine_route_deploy(self, agent_graph):
-        """Test route determination for deployment requests."""
-        message = HumanMessage(content="Deploy the application")
-        route = agent_graph._determine_route(message, "none")
-        assert route == "deployer"
-    
-    def test_determine_route_test(self, agent_graph):
-        """Test route determination for testing requests."""
-        message = HumanMessage(content="Run tests")
-        route = agent_graph._determine_route(message, "none")
-        assert route == "qa"
-    
-    def test_determine_route_code(self, agent_graph):
-        """Test route determination for code requests."""
-        message = HumanMessage(content="Write a function")
-        route = agent_graph._determine_route(message, "none")
-        assert route == "coder"
-    
-    def test_determine_route_default(self, agent_graph):
-        """Test route determination default case."""
-        message = HumanMessage(content="Hello")
+    @pytest.mark.parametrize("content,expected", [
+        ("Deploy the application", "deployer"),
+        ("Run tests", "qa"),
+        ("Write a function", "coder"),
+        ("Hello", "orchestrator"),
+    ])
+    def test_determine_route(self, agent_graph, content, expected):
+        """Test route determination for deploy, test, code and default requests."""
+        message = HumanMessage(content=content)
         route = agent_graph._determine_route(message, "none")
-        assert route == "orchestrator"
+        assert route == expected
     
-    def test_should_end_conversation_error_limit(self, agent_graph, initial_state):
-        """Test conversation ending due to error limit."""
-        # Add error state with high error count
-        from agents.state import update_error_state
-        for i in range(12):
-            initial_state = update_error_state(initial_state, f"Error {i}", "test")
+    @pytest.mark.parametrize("state_fixture,content,expected", [
+        ("error_limit_state", None, True),  # Error limit reached
+        ("initial_state", "goodbye", True),  # Explicit goodbye
+        ("initial_state", "Hello", False),  # Normal conversation continues
+    ])
+    def test_should_end_conversation(self, agent_graph, request, state_fixture, content, expected):
+        """Test conversation ending on error limit or goodbye, and continuing otherwise."""
+        state = request.getfixturevalue(state_fixture)
+        if content is not None:
+            state["messages"] = [HumanMessage(content=content)]
         
-        should_end = agent_graph._should_end_conversation(initial_state)
-        assert should_end is True
-    
-    def test_should_end_conversation_goodbye(self, agent_graph, initial_state):
-        """Test conversation ending due to goodbye message."""
-        initial_state["messages"] = [HumanMessage(content="goodbye")]
-        
-        should_end = agent_graph._should_end_conversation(initial_state)
-        assert should_end is True
-    
-    def test_should_end_conversation_continue(self, agent_graph, initial_state):
-        """Test conversation continuing normally."""
-        initial_state["messages"] = [HumanMessage(content="Hello")]
-        
-        should_end = agent_graph._should_end_conversation(initial_state)
-        assert should_end is False
+        should_end = agent_graph._should_end_conversation(state)
+        assert should_end is expected
     
     def test_get_approvals_healthy(self, agent_graph, initial_state):
         """Test getting approvals when system is healthy."""
@@ -271,14 +280,9 @@ class TestAgentGraph:
         assert "vision" in approvals
         assert "telephony" in approvals
     
-    def test_get_approvals_with_blocked_operations(self, agent_graph, initial_state):
+    def test_get_approvals_with_blocked_operations(self, agent_graph, voice_only_state):
         """Test getting approvals with blocked operations."""
-        # Add error state with blocked operations
-        from agents.state import update_error_state
-        for i in range(4):  # Trigger voice_only degradation
-            initial_state = update_error_state(initial_state, f"Error {i}", "test")
-        
-        approvals = agent_graph._get_approvals(initial_state)
+        approvals = agent_graph._get_approvals(voice_only_state)
         
         assert "voice_processing" in approvals
         assert "vision" not in approvals  # Should be blocked
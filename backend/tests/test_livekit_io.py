@@ -2,14 +2,25 @@
 Tests for LiveKit integration.
 """
 
+import asyncio
+import base64
+import json
 import pytest
+from contextlib import ExitStack
 from unittest.mock import Mock, AsyncMock, patch
-from datetime import datetime, timedelta
+from datetime import datetime
+from types import SimpleNamespace
 
-from tools.livekit_io import LiveKitManager, LiveKitError
+import numpy as np
+from livekit import rtc
+from tools.livekit_io import AUDIO_SOURCE_QUEUE_MS, LiveKitManager, LiveKitError, _decode_jwt_claims
 
 
-@pytest.fixture
+FIXED_TIME = datetime(2024, 1, 1)
+ROOM_SPEC = ["on", "connect", "disconnect", "local_participant", "remote_participants"]
+
+
+@pytest.fixture(scope="class")
 def mock_config():
     """Mock configuration for LiveKit."""
     return {
@@ -19,13 +30,25 @@ def mock_config():
     }
 
 
-@pytest.fixture
-def livekit_manager(mock_config):
-    """Create LiveKit manager for testing."""
+@pytest.fixture(scope="class")
+def shared_livekit_manager(mock_config):
+    """Create one LiveKit manager shared by a test class."""
     with patch('tools.livekit_io.api.RoomService'):
         return LiveKitManager(mock_config)
 
 
+@pytest.fixture
+def livekit_manager(shared_livekit_manager):
+    """Provide the shared LiveKit manager, resetting its session state after each test."""
+    yield shared_livekit_manager
+    
+    shared_livekit_manager.current_room = None
+    shared_livekit_manager.audio_track = None
+    shared_livekit_manager.connection_callbacks.clear()
+    shared_livekit_manager.room_service.reset_mock()
+    shared_livekit_manager.clear_caches()
+
+
 class TestLiveKitManager:
     """Test LiveKit manager functionality."""
     
@@ -53,66 +76,127 @@ class TestLiveKitManager:
         assert "Missing LiveKit configuration" in str(exc_info.value)
         assert "Set LIVEKIT_URL" in exc_info.value.remediation
     
-    def test_generate_token_success(self, livekit_manager):
-        """Test successful token generation."""
+    @pytest.mark.parametrize("token_kwargs", [
+        {"metadata": "test-metadata"},
+        {"ttl_hours": 12},  # In real implementation, would verify TTL in token
+    ], ids=["with_metadata", "with_ttl"])
+    def test_generate_token(self, livekit_manager, token_kwargs):
+        """Test token generation with metadata and with a custom TTL."""
         token = livekit_manager.generate_token(
             identity="test-user",
             room_name="test-room",
-            metadata="test-metadata"
+            **token_kwargs
         )
         
         assert token is not None
         assert isinstance(token, str)
         assert len(token) > 0
     
-    def test_generate_token_with_ttl(self, livekit_manager):
-        """Test token generation with custom TTL."""
-        token = livekit_manager.generate_token(
-            identity="test-user",
-            room_name="test-room",
-            ttl_hours=12
+    def test_generate_token_reused(self, livekit_manager):
+        """Test repeated token requests with the same arguments reuse the token."""
+        with patch('tools.livekit_io.AccessToken.to_jwt', return_value="test-jwt") as mock_to_jwt:
+            first = livekit_manager.generate_token("test-user", "test-room")
+            second = livekit_manager.generate_token("test-user", "test-room")
+            livekit_manager.generate_token("test-user", "other-room")
+        
+        assert first == second == "test-jwt"
+        assert mock_to_jwt.call_count == 2
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("from_jwt_kwargs,expected", [
+        ({"return_value": SimpleNamespace(
+            video_grants=SimpleNamespace(room="test-room", room_admin=False)
+        )}, True),
+        ({"side_effect": Exception("Invalid token")}, False),
+    ], ids=["valid", "invalid"])
+    async def test_verify_token(self, livekit_manager, from_jwt_kwargs, expected):
+        """Test token verification with valid and invalid tokens."""
+        token = livekit_manager.generate_token("test-user", "test-room")
+        
+        with patch('tools.livekit_io.AccessToken.from_jwt', **from_jwt_kwargs):
+            result = await livekit_manager.verify_token(token, "test-room")
+        
+        assert result is expected
+    
+    @pytest.mark.asyncio
+    async def test_verify_token_cached(self, livekit_manager):
+        """Test repeated verification of the same token skips re-decoding."""
+        token = livekit_manager.generate_token("test-user", "test-room")
+        valid_token = SimpleNamespace(
+            video_grants=SimpleNamespace(room="test-room", room_admin=False)
         )
         
-        assert token is not None
-        # In real implementation, would verify TTL in token
+        with patch('tools.livekit_io.AccessToken.from_jwt', return_value=valid_token) as mock_from_jwt:
+            assert await livekit_manager.verify_token(token, "test-room") is True
+            assert await livekit_manager.verify_token(token, "test-room") is True
+        
+        mock_from_jwt.assert_called_once()
+    
+    def test_generate_token_embeds_grants(self, livekit_manager):
+        """Test that generated tokens carry the identity and room grant in their payload."""
+        token = livekit_manager.generate_token("test-user", "test-room", metadata='{"role": "agent"}')
+        
+        claims = _decode_jwt_claims(token)
+        assert claims["sub"] == "test-user"
+        assert claims["metadata"] == '{"role": "agent"}'
+        assert claims["video"]["room"] == "test-room"
+        assert claims["video"]["roomJoin"] is True
     
-    def test_verify_token_valid(self, livekit_manager):
-        """Test token verification with valid token."""
-        # Generate a token first
+    @pytest.mark.asyncio
+    async def test_verify_token_generated_token_passes_room_check(self, livekit_manager):
+        """Test that a token issued by the manager reaches full verification for its own room."""
         token = livekit_manager.generate_token("test-user", "test-room")
+        valid_token = SimpleNamespace(
+            video_grants=SimpleNamespace(room="test-room", room_admin=False)
+        )
+        
+        with patch('tools.livekit_io.AccessToken.from_jwt', return_value=valid_token) as mock_from_jwt:
+            assert await livekit_manager.verify_token(token, "test-room") is True
+        
+        mock_from_jwt.assert_called_once_with(token, livekit_manager.api_secret)
+    
+    @pytest.mark.asyncio
+    async def test_verify_token_other_room_skips_verification(self, livekit_manager):
+        """Test that a token granted for another room is rejected without full decoding."""
+        token = livekit_manager.generate_token("test-user", "other-room")
         
-        # Mock the verification
         with patch('tools.livekit_io.AccessToken.from_jwt') as mock_from_jwt:
-            mock_token = Mock()
-            mock_grants = Mock()
-            mock_grants.room = "test-room"
-            mock_token.video_grants = mock_grants
-            mock_from_jwt.return_value = mock_token
-            
-            result = asyncio.run(livekit_manager.verify_token(token, "test-room"))
-            assert result is True
+            assert await livekit_manager.verify_token(token, "test-room") is False
+        
+        mock_from_jwt.assert_not_called()
     
-    def test_verify_token_invalid(self, livekit_manager):
-        """Test token verification with invalid token."""
-        with patch('tools.livekit_io.AccessToken.from_jwt', side_effect=Exception("Invalid token")):
-            result = asyncio.run(livekit_manager.verify_token("invalid-token", "test-room"))
-            assert result is False
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("video", ["test-room", ["test-room"], 1], ids=["str", "list", "int"])
+    async def test_verify_token_malformed_video_claim(self, livekit_manager, video):
+        """Test that a token whose video claim is not an object is rejected, not raised."""
+        payload = base64.urlsafe_b64encode(json.dumps({"video": video}).encode()).rstrip(b"=").decode()
+        token = f"e30.{payload}.sig"
+        
+        with patch('tools.livekit_io.AccessToken.from_jwt') as mock_from_jwt:
+            assert await livekit_manager.verify_token(token, "test-room") is False
+        
+        mock_from_jwt.assert_not_called()
     
     @pytest.mark.asyncio
     async def test_create_room_success(self, livekit_manager):
         """Test successful room creation."""
-        mock_room_info = Mock()
-        mock_room_info.name = "test-room"
-        mock_room_info.sid = "room-sid-123"
-        mock_room_info.creation_time = datetime.utcnow()
-        mock_room_info.max_participants = 10
+        mock_room_info = SimpleNamespace(
+            name="test-room",
+            sid="room-sid-123",
+            creation_time=FIXED_TIME,
+            max_participants=10
+        )
         
-        with patch.object(livekit_manager.room_service, 'create_room', return_value=mock_room_info):
+        with patch.object(livekit_manager.room_service, 'create_room', new_callable=AsyncMock, return_value=mock_room_info) as mock_create:
             result = await livekit_manager.create_room("test-room", 10)
             
             assert result["name"] == "test-room"
             assert result["sid"] == "room-sid-123"
             assert result["max_participants"] == 10
+        
+        metadata = json.loads(mock_create.call_args.args[0].metadata)
+        assert metadata["agent_room"] is True
+        assert "created_at" in metadata
     
     @pytest.mark.asyncio
     async def test_create_room_failure(self, livekit_manager):
@@ -125,19 +209,18 @@ class TestLiveKitManager:
             assert "check room name format" in exc_info.value.remediation.lower()
     
     @pytest.mark.asyncio
-    async def test_join_room_success(self, livekit_manager):
+    @patch('tools.livekit_io.rtc.Room')
+    async def test_join_room_success(self, mock_room_class, livekit_manager):
         """Test successful room joining."""
-        mock_room = Mock()
+        mock_room = mock_room_class.return_value
+        mock_room.connect = AsyncMock()
         
-        with patch('tools.livekit_io.rtc.Room', return_value=mock_room):
-            with patch.object(mock_room, 'connect', new_callable=AsyncMock):
-                with patch.object(livekit_manager, 'generate_token', return_value="test-token"):
-                    
-                    result = await livekit_manager.join_room("test-room", "test-user")
-                    
-                    assert result == mock_room
-                    assert livekit_manager.current_room == mock_room
-                    mock_room.connect.assert_called_once()
+        with patch.object(livekit_manager, 'generate_token', return_value="test-token"):
+            result = await livekit_manager.join_room("test-room", "test-user")
+        
+        assert result == mock_room
+        assert livekit_manager.current_room == mock_room
+        mock_room.connect.assert_called_once()
     
     @pytest.mark.asyncio
     async def test_join_room_failure(self, livekit_manager):
@@ -155,10 +238,11 @@ class TestLiveKitManager:
     @pytest.mark.asyncio
     async def test_leave_room_success(self, livekit_manager):
         """Test successful room leaving."""
-        mock_room = Mock()
+        mock_room = Mock(spec_set=ROOM_SPEC)
         mock_room.disconnect = AsyncMock()
+        mock_room.remote_participants = {"user1": Mock()}
         livekit_manager.current_room = mock_room
-        livekit_manager.participants["user1"] = Mock()
+        assert list(livekit_manager.participants) == ["user1"]
         
         await livekit_manager.leave_room()
         
@@ -173,26 +257,153 @@ class TestLiveKitManager:
         await livekit_manager.leave_room()
         assert livekit_manager.current_room is None
     
+    @pytest.mark.asyncio
+    async def test_leave_room_cancels_track_tasks(self, livekit_manager):
+        """Test that leaving the room cancels per-track audio tasks."""
+        mock_room = Mock(spec_set=ROOM_SPEC)
+        mock_room.disconnect = AsyncMock()
+        livekit_manager.current_room = mock_room
+        task = livekit_manager._spawn_track_task(asyncio.sleep(60), "audio-reader-test-user")
+        
+        await livekit_manager.leave_room()
+        await asyncio.gather(task, return_exceptions=True)
+        
+        assert task.cancelled()
+        assert task.get_name() == "audio-reader-test-user"
+        assert not livekit_manager._track_tasks
+    
     @pytest.mark.asyncio
     async def test_publish_audio_track_success(self, livekit_manager):
         """Test successful audio track publishing."""
-        mock_room = Mock()
+        mock_room = Mock(spec_set=ROOM_SPEC)
         mock_participant = Mock()
         mock_track = Mock()
         mock_source = Mock()
         
         livekit_manager.current_room = mock_room
         mock_room.local_participant = mock_participant
+        mock_participant.publish_track = AsyncMock()
+        mock_track.source.capture_frame = AsyncMock()
+        
+        with ExitStack() as stack:
+            mock_source_class = stack.enter_context(
+                patch('tools.livekit_io.rtc.AudioSource', return_value=mock_source)
+            )
+            stack.enter_context(
+                patch('tools.livekit_io.rtc.LocalAudioTrack.create_audio_track', return_value=mock_track)
+            )
+            
+            audio_data = b'\x00\x01' * 100  # Mock audio data
+            await livekit_manager.publish_audio_track(audio_data)
+        
+        # Verify track was published
+        mock_participant.publish_track.assert_called_once()
+        mock_source_class.assert_called_once_with(16000, 1, queue_size_ms=AUDIO_SOURCE_QUEUE_MS)
+    
+    @pytest.mark.asyncio
+    async def test_publish_audio_track_10ms_frames(self, livekit_manager):
+        """Test that audio is split into 10 ms frames with a silence-padded tail."""
+        livekit_manager.current_room = Mock(spec_set=ROOM_SPEC)
+        livekit_manager.audio_track = Mock()
+        captured = []
+        
+        async def capture_frame(frame):
+            captured.append(bytes(memoryview(frame.data).cast('B')))
+        
+        livekit_manager.audio_track.source.capture_frame = capture_frame
+        
+        # 16 kHz -> 160 samples (320 bytes) per frame; 2.5 frames of audio
+        await livekit_manager.publish_audio_track(b'\x01\x00' * 400, sample_rate=16000)
+        
+        assert [len(frame) for frame in captured] == [320, 320, 320]
+        assert captured[2] == b'\x01\x00' * 80 + b'\x00' * 160
+    
+    @pytest.mark.asyncio
+    async def test_publish_audio_track_reuses_frames(self, livekit_manager):
+        """Test that same-sized chunks are pushed through a pooled frame."""
+        livekit_manager.current_room = Mock(spec_set=ROOM_SPEC)
+        livekit_manager.audio_track = Mock()
+        capture_frame = livekit_manager.audio_track.source.capture_frame = AsyncMock()
+        
+        await livekit_manager.publish_audio_track(b'\x01\x00' * 160)
+        await livekit_manager.publish_audio_track(b'\x02\x00' * 160)
+        
+        first_frame = capture_frame.await_args_list[0].args[0]
+        second_frame = capture_frame.await_args_list[1].args[0]
+        assert first_frame is second_frame
+        assert bytes(memoryview(second_frame.data).cast('B')) == b'\x02\x00' * 160
+    
+    @pytest.mark.asyncio
+    async def test_publish_audio_track_stereo(self, livekit_manager):
+        """Test that stereo audio is framed by samples per channel, not total samples."""
+        livekit_manager.current_room = Mock(spec_set=ROOM_SPEC)
+        livekit_manager.audio_track = Mock()
+        capture_frame = livekit_manager.audio_track.source.capture_frame = AsyncMock()
+        
+        # 10 ms of 48 kHz stereo: 480 samples per channel, 1920 bytes
+        await livekit_manager.publish_audio_track(b'\x01\x00' * 960, sample_rate=48000, num_channels=2)
+        
+        frame = capture_frame.await_args.args[0]
+        capture_frame.assert_awaited_once()
+        assert frame.num_channels == 2
+        assert frame.samples_per_channel == 480
+    
+    @pytest.mark.asyncio
+    async def test_publish_audio_batch(self, livekit_manager):
+        """Test that a batch is submitted as one frame holding the chunks in order."""
+        livekit_manager.current_room = Mock(spec_set=ROOM_SPEC)
+        livekit_manager.audio_track = Mock()
+        captured = []
+        
+        async def capture_frame(frame):
+            captured.append((frame.samples_per_channel, bytes(memoryview(frame.data).cast('B'))))
         
-        with patch('tools.livekit_io.rtc.AudioSource', return_value=mock_source):
-            with patch('tools.livekit_io.rtc.LocalAudioTrack.create_audio_track', return_value=mock_track):
-                with patch.object(mock_participant, 'publish_track', new_callable=AsyncMock):
-                    
-                    audio_data = b'\x00\x01' * 100  # Mock audio data
-                    await livekit_manager.publish_audio_track(audio_data)
-                    
-                    # Verify track was published
-                    mock_participant.publish_track.assert_called_once()
+        livekit_manager.audio_track.source.capture_frame = capture_frame
+        chunks = [bytes([i, 0]) * 160 for i in range(3)]
+        chunks.append(b'\x07\x00' * 10)
+        
+        await livekit_manager.publish_audio_batch(chunks, sample_rate=16000)
+        
+        assert len(captured) == 1
+        samples_per_channel, data = captured[0]
+        assert samples_per_channel == 4 * 160
+        assert data == b"".join(chunks[:3]) + chunks[3] + b'\x00' * 300
+    
+    @pytest.mark.asyncio
+    async def test_publish_audio_batch_empty(self, livekit_manager):
+        """Test that an empty batch publishes nothing."""
+        livekit_manager.current_room = Mock(spec_set=ROOM_SPEC)
+        livekit_manager.audio_track = Mock()
+        livekit_manager.audio_track.source.capture_frame = AsyncMock()
+        
+        await livekit_manager.publish_audio_batch([], sample_rate=16000)
+        
+        livekit_manager.audio_track.source.capture_frame.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_publish_audio_batch_rejects_long_chunks(self, livekit_manager):
+        """Test that chunks longer than one 10 ms frame are rejected."""
+        livekit_manager.current_room = Mock(spec_set=ROOM_SPEC)
+        livekit_manager.audio_track = Mock()
+        
+        with pytest.raises(LiveKitError) as exc_info:
+            await livekit_manager.publish_audio_batch([b'\x00' * 322], sample_rate=16000)
+        
+        assert "at most 10 ms" in str(exc_info.value)
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("sample_rate", [22050, 11025])
+    async def test_publish_audio_rejects_uneven_sample_rate(self, livekit_manager, sample_rate):
+        """Test that rates without an exact 10 ms frame size are rejected."""
+        livekit_manager.current_room = Mock(spec_set=ROOM_SPEC)
+        livekit_manager.audio_track = Mock()
+        
+        with pytest.raises(LiveKitError) as exc_info:
+            await livekit_manager.publish_audio_track(b'\x00\x00' * 441, sample_rate=sample_rate)
+        with pytest.raises(LiveKitError):
+            await livekit_manager.publish_audio_batch([b'\x00\x00'], sample_rate=sample_rate)
+        
+        assert "divisible by 100" in exc_info.value.remediation
     
     @pytest.mark.asyncio
     async def test_publish_audio_track_no_room(self, livekit_manager):
@@ -206,7 +417,7 @@ class TestLiveKitManager:
     @pytest.mark.asyncio
     async def test_subscribe_to_audio(self, livekit_manager):
         """Test audio subscription."""
-        mock_room = Mock()
+        mock_room = Mock(spec_set=ROOM_SPEC)
         livekit_manager.current_room = mock_room
         
         callback = Mock()
@@ -231,9 +442,107 @@ class TestLiveKitManager:
         # Verify room.on was called
         assert hasattr(mock_room, 'on')
     
+    @staticmethod
+    def _fake_audio_stream(frames):
+        """Build an AudioStream stand-in that yields the given frames, raising any exceptions among them."""
+        class FakeAudioStream:
+            def __init__(self, track):
+                self.frames = iter(frames)
+            
+            def __aiter__(self):
+                return self
+            
+            async def __anext__(self):
+                try:
+                    frame = next(self.frames)
+                except StopIteration:
+                    raise StopAsyncIteration
+                if isinstance(frame, Exception):
+                    raise frame
+                return frame
+        
+        return FakeAudioStream
+    
+    async def _deliver_audio(self, livekit_manager, frames, callback):
+        """Subscribe, fire track_subscribed for an audio track and run its tasks to completion."""
+        mock_room = Mock(spec_set=ROOM_SPEC)
+        livekit_manager.current_room = mock_room
+        
+        with patch('tools.livekit_io.rtc.AudioStream', self._fake_audio_stream(frames)):
+            await livekit_manager.subscribe_to_audio(callback)
+            handler = mock_room.on.call_args.args[1]
+            handler(
+                SimpleNamespace(kind=rtc.TrackKind.KIND_AUDIO),
+                Mock(),
+                SimpleNamespace(identity="test-user")
+            )
+        
+        await asyncio.wait_for(asyncio.gather(*livekit_manager._track_tasks), timeout=1)
+    
+    @pytest.mark.asyncio
+    async def test_subscribe_to_audio_forwards_samples(self, livekit_manager):
+        """Test that inbound frames reach the callback as int16 arrays sharing the frame buffer."""
+        frame = SimpleNamespace(data=memoryview(bytearray(b'\x01\x00' * 160)).cast('h'))
+        callback = Mock()
+        
+        await self._deliver_audio(livekit_manager, [frame], callback)
+        
+        samples = callback.call_args.args[0]
+        assert samples.dtype == np.int16
+        assert samples.tolist() == [1] * 160
+        assert np.shares_memory(samples, np.asarray(frame.data))
+    
+    @pytest.mark.asyncio
+    async def test_subscribe_to_audio_drops_oldest_when_backlogged(self, livekit_manager):
+        """Test that a backlog beyond the queue size drops the oldest frames."""
+        frames = [
+            SimpleNamespace(data=memoryview(bytearray([i, 0])).cast('h'))
+            for i in range(40)
+        ]
+        callback = Mock()
+        
+        await self._deliver_audio(livekit_manager, frames, callback)
+        
+        delivered = [call.args[0][0] for call in callback.call_args_list]
+        assert delivered == list(range(8, 40))
+    
+    @pytest.mark.asyncio
+    async def test_subscribe_to_audio_survives_callback_errors(self, livekit_manager):
+        """Test that a raising callback does not stop delivery of later frames."""
+        frames = [
+            SimpleNamespace(data=memoryview(bytearray([i, 0])).cast('h'))
+            for i in range(3)
+        ]
+        callback = Mock(side_effect=[ValueError("bad frame"), None, None])
+        
+        await self._deliver_audio(livekit_manager, frames, callback)
+        
+        assert callback.call_count == 3
+        assert callback.call_args.args[0][0] == 2
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("num_frames,expected", [
+        (2, [0, 1]),
+        (40, list(range(9, 40))),
+    ], ids=["short", "backlogged"])
+    async def test_subscribe_to_audio_stream_error_stops_dispatcher(self, livekit_manager, num_frames, expected):
+        """Test that a stream failing mid-way still ends the dispatcher after the frames read so far."""
+        frames = [
+            SimpleNamespace(data=memoryview(bytearray([i, 0])).cast('h'))
+            for i in range(num_frames)
+        ]
+        callback = Mock()
+        
+        with patch('tools.livekit_io.logger') as mock_logger:
+            await self._deliver_audio(livekit_manager, [*frames, RuntimeError("stream reset"), frames[0]], callback)
+        
+        assert [call.args[0][0] for call in callback.call_args_list] == expected
+        assert "stream reset" in str(mock_logger.error.call_args)
+        assert not livekit_manager._track_tasks
+    
     def test_setup_room_events(self, livekit_manager):
         """Test room event handler setup."""
-        mock_room = Mock()
+        mock_room = Mock(spec_set=ROOM_SPEC)
         
         # Mock the on method to capture handlers
         handlers = {}
@@ -265,16 +574,16 @@ class TestLiveKitManager:
     @pytest.mark.asyncio
     async def test_get_room_info_success(self, livekit_manager):
         """Test getting room information."""
-        mock_room_list = Mock()
-        mock_room = Mock()
-        mock_room.name = "test-room"
-        mock_room.sid = "room-123"
-        mock_room.num_participants = 2
-        mock_room.creation_time = datetime.utcnow()
-        mock_room.metadata = '{"test": true}'
-        mock_room_list.rooms = [mock_room]
-        
-        with patch.object(livekit_manager.room_service, 'list_rooms', return_value=mock_room_list):
+        mock_room = SimpleNamespace(
+            name="test-room",
+            sid="room-123",
+            num_participants=2,
+            creation_time=FIXED_TIME,
+            metadata='{"test": true}'
+        )
+        mock_room_list = SimpleNamespace(rooms=[mock_room])
+        
+        with patch.object(livekit_manager.room_service, 'list_rooms', new_callable=AsyncMock, return_value=mock_room_list):
             result = await livekit_manager.get_room_info("test-room")
             
             assert result["name"] == "test-room"
@@ -284,10 +593,9 @@ class TestLiveKitManager:
     @pytest.mark.asyncio
     async def test_get_room_info_not_found(self, livekit_manager):
         """Test getting room information for non-existent room."""
-        mock_room_list = Mock()
-        mock_room_list.rooms = []  # Empty list
+        mock_room_list = SimpleNamespace(rooms=[])  # Empty list
         
-        with patch.object(livekit_manager.room_service, 'list_rooms', return_value=mock_room_list):
+        with patch.object(livekit_manager.room_service, 'list_rooms', new_callable=AsyncMock, return_value=mock_room_list):
             with pytest.raises(LiveKitError) as exc_info:
                 await livekit_manager.get_room_info("non-existent-room")
             
@@ -296,16 +604,16 @@ class TestLiveKitManager:
     @pytest.mark.asyncio
     async def test_list_participants_success(self, livekit_manager):
         """Test listing room participants."""
-        mock_participant_list = Mock()
-        mock_participant = Mock()
-        mock_participant.identity = "user1"
-        mock_participant.name = "User One"
-        mock_participant.metadata = "test metadata"
-        mock_participant.joined_at = datetime.utcnow()
-        mock_participant.is_publisher = True
-        mock_participant_list.participants = [mock_participant]
-        
-        with patch.object(livekit_manager.room_service, 'list_participants', return_value=mock_participant_list):
+        mock_participant = SimpleNamespace(
+            identity="user1",
+            name="User One",
+            metadata="test metadata",
+            joined_at=FIXED_TIME,
+            is_publisher=True
+        )
+        mock_participant_list = SimpleNamespace(participants=[mock_participant])
+        
+        with patch.object(livekit_manager.room_service, 'list_participants', new_callable=AsyncMock, return_value=mock_participant_list):
             result = await livekit_manager.list_participants("test-room")
             
             assert len(result) == 1
@@ -316,15 +624,49 @@ class TestLiveKitManager:
     @pytest.mark.asyncio
     async def test_health_check_healthy(self, livekit_manager):
         """Test health check when service is healthy."""
-        mock_room_list = Mock()
-        mock_room_list.rooms = []
+        mock_room_list = SimpleNamespace(rooms=[])
         
-        with patch.object(livekit_manager.room_service, 'list_rooms', return_value=mock_room_list):
+        with patch.object(livekit_manager.room_service, 'list_rooms', new_callable=AsyncMock, return_value=mock_room_list):
             result = await livekit_manager.health_check()
             
             assert result["status"] == "healthy"
             assert result["url"] == livekit_manager.url
             assert result["connected"] is False
+            assert result["latency_ms"] >= 0
+    
+    @pytest.mark.asyncio
+    async def test_health_check_refreshes_rooms_cache(self, livekit_manager):
+        """Test that every health check calls the API and its listing serves later room lookups."""
+        mock_room_list = SimpleNamespace(rooms=[
+            SimpleNamespace(
+                name="test-room",
+                sid="room-sid-123",
+                num_participants=0,
+                creation_time=FIXED_TIME,
+                metadata=""
+            )
+        ])
+        
+        with patch.object(livekit_manager.room_service, 'list_rooms', new_callable=AsyncMock, return_value=mock_room_list) as mock_list:
+            await asyncio.gather(*(livekit_manager.health_check() for _ in range(3)))
+            result = await livekit_manager.get_room_info("test-room")
+        
+        assert result["sid"] == "room-sid-123"
+        assert mock_list.await_count == 3
+    
+    @pytest.mark.asyncio
+    async def test_health_check_ignores_cached_rooms(self, livekit_manager):
+        """Test that a fresh room listing does not mask an unreachable API."""
+        mock_room_list = SimpleNamespace(rooms=[
+            SimpleNamespace(name="test-room", sid="room-sid-123", num_participants=0, creation_time=FIXED_TIME, metadata="")
+        ])
+        with patch.object(livekit_manager.room_service, 'list_rooms', new_callable=AsyncMock, return_value=mock_room_list):
+            await livekit_manager.get_room_info("test-room")
+        
+        with patch.object(livekit_manager.room_service, 'list_rooms', side_effect=Exception("Service unavailable")):
+            result = await livekit_manager.health_check()
+        
+        assert result["status"] == "unhealthy"
     
     @pytest.mark.asyncio
     async def test_health_check_unhealthy(self, livekit_manager):
@@ -335,7 +677,18 @@ class TestLiveKitManager:
             assert result["status"] == "unhealthy"
             assert "Service unavailable" in result["error"]
             assert "remediation" in result
-
-
-# Import asyncio for async tests
-import asyncio
\ No newline at end of file
+    
+    @pytest.mark.asyncio
+    async def test_health_check_timeout(self, livekit_manager):
+        """Test that a LiveKit API slower than the probe timeout is reported unhealthy."""
+        async def slow_list_rooms(request):
+            await asyncio.sleep(1)
+        
+        with ExitStack() as stack:
+            stack.enter_context(patch('tools.livekit_io.HEALTH_CHECK_TIMEOUT_SECONDS', 0.01))
+            stack.enter_context(patch.object(livekit_manager.room_service, 'list_rooms', side_effect=slow_list_rooms))
+            result = await livekit_manager.health_check()
+        
+        assert result["status"] == "unhealthy"
+        assert "did not respond within" in result["error"]
+        assert result["latency_ms"] < 1000
@@ -0,0 +1,170 @@
+"""
+Tests for the local JSONL memory store.
+"""
+
+import json
+import pytest
+from datetime import datetime
+from unittest.mock import patch
+
+from tools.memory_mem0 import LocalMemoryStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Local memory store rooted in a temporary directory."""
+    return LocalMemoryStore(str(tmp_path))
+
+
+def _log_lines(tmp_path, session_id="session-1"):
+    """Return the raw lines of a session log."""
+    return (tmp_path / "test-project" / f"{session_id}.jsonl").read_text().splitlines()
+
+
+class TestLocalMemoryStore:
+    """Test the append-only session log, its cache and recovery paths."""
+    
+    def test_add_and_get_memories(self, store):
+        """Test memories come back in insertion order with their content."""
+        first = store.add_memory("test-project", "session-1", {"text": "likes tea"})
+        second = store.add_memory("test-project", "session-1", {"text": "lives in Oslo"})
+        
+        memories = store.get_memories("test-project", "session-1")
+        
+        assert [mem["id"] for mem in memories] == [first, second]
+        assert memories[0]["content"] == {"text": "likes tea"}
+        assert memories[0]["session_id"] == "session-1"
+        assert first != second
+    
+    def test_add_memory_serializes_rich_types(self, store):
+        """Test datetime values and non-string keys in memory content are stored as JSON."""
+        store.add_memory("test-project", "session-1", {"at": datetime(2024, 1, 1, 12, 30), 1: "one"})
+        
+        content = LocalMemoryStore(str(store.storage_path)).get_memories("test-project", "session-1")[0]["content"]
+        
+        assert content == {"at": "2024-01-01T12:30:00", "1": "one"}
+    
+    def test_get_memories_unknown_session(self, store):
+        """Test an unknown session has no memories."""
+        assert store.get_memories("test-project", "missing") == []
+    
+    def test_search_memories(self, store):
+        """Test case-insensitive substring search over memory content."""
+        store.add_memory("test-project", "session-1", {"text": "Likes Tea"})
+        store.add_memory("test-project", "session-1", {"text": "likes coffee"})
+        
+        matches = store.search_memories("test-project", "session-1", "tea")
+        
+        assert [mem["content"]["text"] for mem in matches] == ["Likes Tea"]
+    
+    def test_delete_memories_appends_tombstones(self, store, tmp_path):
+        """Test deletes record tombstones and only count live memories."""
+        keep = store.add_memory("test-project", "session-1", {"text": "keep"})
+        drop = store.add_memory("test-project", "session-1", {"text": "drop"})
+        
+        assert store.delete_memories("test-project", "session-1", [drop, "mem_unknown"]) == 1
+        assert store.delete_memories("test-project", "session-1", [drop]) == 0
+        
+        assert [mem["id"] for mem in store.get_memories("test-project", "session-1")] == [keep]
+        assert json.loads(_log_lines(tmp_path)[-1]) == {"_tombstone": drop}
+    
+    def test_delete_memories_unknown_session(self, store):
+        """Test deleting from a session without a log is a no-op."""
+        assert store.delete_memories("test-project", "missing", ["mem_1"]) == 0
+    
+    def test_compaction_drops_tombstones(self, store, tmp_path):
+        """Test the log is rewritten without tombstones once past the threshold."""
+        ids = [store.add_memory("test-project", "session-1", {"n": n}) for n in range(4)]
+        
+        with patch("tools.memory_mem0.COMPACT_TOMBSTONE_THRESHOLD", 2):
+            store.delete_memories("test-project", "session-1", ids[:2])
+            assert len(_log_lines(tmp_path)) == 6
+            
+            store.delete_memories("test-project", "session-1", ids[2:3])
+        
+        lines = [json.loads(line) for line in _log_lines(tmp_path)]
+        assert lines == store.get_memories("test-project", "session-1")
+        assert [mem["id"] for mem in lines] == ids[3:]
+        assert not (tmp_path / "test-project" / "session-1.jsonl.tmp").exists()
+    
+    def test_legacy_json_migrated(self, store, tmp_path):
+        """Test a pre-JSONL session file is converted and removed on first access."""
+        legacy_file = tmp_path / "test-project" / "session-1.json"
+        legacy_file.parent.mkdir()
+        legacy_file.write_text(json.dumps({
+            "memories": [{"id": "mem_old", "content": {"text": "legacy"}, "session_id": "session-1"}],
+            "metadata": {"total_memories": 1}
+        }, indent=2))
+        
+        memories = store.get_memories("test-project", "session-1")
+        
+        assert [mem["id"] for mem in memories] == ["mem_old"]
+        assert not legacy_file.exists()
+        assert (tmp_path / "test-project" / "session-1.jsonl").exists()
+    
+    def test_cache_reuses_parsed_session(self, store):
+        """Test repeated reads and local writes do not re-parse the log."""
+        store.add_memory("test-project", "session-1", {"text": "one"})
+        
+        with patch.object(LocalMemoryStore, "_read_log", wraps=LocalMemoryStore._read_log) as mock_read:
+            store.get_memories("test-project", "session-1")
+            store.add_memory("test-project", "session-1", {"text": "two"})
+            memories = store.search_memories("test-project", "session-1", "")
+        
+        assert len(memories) == 2
+        mock_read.assert_called_once()
+    
+    def test_cache_invalidated_by_external_write(self, store, tmp_path):
+        """Test a write from another store instance is picked up on the next read."""
+        store.add_memory("test-project", "session-1", {"text": "one"})
+        assert len(store.get_memories("test-project", "session-1")) == 1
+        
+        LocalMemoryStore(str(tmp_path)).add_memory("test-project", "session-1", {"text": "two"})
+        
+        memories = store.get_memories("test-project", "session-1")
+        assert [mem["content"]["text"] for mem in memories] == ["one", "two"]
+    
+    @pytest.mark.parametrize("operation", ["add", "delete"])
+    def test_cache_dropped_when_write_races_external_append(self, store, tmp_path, operation):
+        """Test an append landing between the cache check and this store's write is not lost."""
+        first = store.add_memory("test-project", "session-1", {"text": "one"})
+        assert len(store.get_memories("test-project", "session-1")) == 1
+        
+        other = LocalMemoryStore(str(tmp_path))
+        real_append = LocalMemoryStore._append_lines
+        
+        def append_after_other_writer(session_file, records):
+            real_append(session_file, [{"id": "mem_other", "content": {"text": "from-b"}}])
+            return real_append(session_file, records)
+        
+        with patch.object(LocalMemoryStore, "_append_lines", side_effect=append_after_other_writer):
+            if operation == "add":
+                store.add_memory("test-project", "session-1", {"text": "two"})
+            else:
+                store.delete_memories("test-project", "session-1", [first])
+        
+        expected = other.get_memories("test-project", "session-1")
+        assert "mem_other" in [mem["id"] for mem in expected]
+        assert store.get_memories("test-project", "session-1") == expected
+    
+    def test_get_memories_returns_copy(self, store):
+        """Test mutating a returned list does not affect the cached session."""
+        store.add_memory("test-project", "session-1", {"text": "one"})
+        
+        store.get_memories("test-project", "session-1").clear()
+        
+        assert len(store.get_memories("test-project", "session-1")) == 1
+    
+    def test_torn_tail_recovered(self, store, tmp_path):
+        """Test a partial final line is skipped and later writes remain readable."""
+        first = store.add_memory("test-project", "session-1", {"text": "one"})
+        log_file = tmp_path / "test-project" / "session-1.jsonl"
+        with open(log_file, "ab") as f:
+            f.write(b'{"id":"mem_torn","cont')
+        
+        assert [mem["id"] for mem in store.get_memories("test-project", "session-1")] == [first]
+        
+        second = store.add_memory("test-project", "session-1", {"text": "two"})
+        assert [mem["id"] for mem in store.get_memories("test-project", "session-1")] == [first, second]
+        assert store.delete_memories("test-project", "session-1", [first]) == 1
+        assert [mem["id"] for mem in store.get_memories("test-project", "session-1")] == [second]
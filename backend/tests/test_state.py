@@ -108,6 +108,17 @@ class TestAgentState:
         assert state["media_events"][-1]["data"]["index"] == 104
         assert state["media_events"][0]["data"]["index"] == 5
     
+    def test_add_media_event_trims_oversized_history(self):
+        """Test a history rebuilt past the limit is trimmed back on the next event."""
+        state = create_initial_state()
+        state["media_events"] = [{"data": {"index": i}} for i in range(150)]
+        
+        state = add_media_event(state, "test_event", {"index": 150})
+        
+        assert len(state["media_events"]) == 100
+        assert state["media_events"][0]["data"]["index"] == 51
+        assert state["media_events"][-1]["data"]["index"] == 150
+    
     def test_add_vision_input(self):
         """Test adding vision inputs."""
         state = create_initial_state()
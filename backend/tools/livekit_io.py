@@ -4,15 +4,70 @@ Handles connection lifecycle and provides remediation for common issues.
 """
 
 import asyncio
+import base64
+import json
 import logging
-from typing import Dict, Any, Optional, Callable
+import time
+from collections import OrderedDict, deque
+from functools import lru_cache
+from typing import Dict, Any, Optional, Callable, Coroutine, Deque, List, Mapping, Set, Tuple
 from datetime import datetime, timedelta
 
+import numpy as np
+
 from livekit import api, rtc
 from livekit.api import AccessToken, VideoGrants
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on cached token verification decisions
+VERIFY_CACHE_SIZE = 4096
+
+# Generated tokens are reused until they are this close to expiring
+TOKEN_CACHE_SIZE = 1024
+TOKEN_REUSE_MARGIN_SECONDS = 600
+
+# Reusable audio frames kept for the current frame shape
+AUDIO_FRAME_POOL_SIZE = 8
+
+# Inbound frames buffered per subscribed track before the oldest is dropped
+AUDIO_CALLBACK_QUEUE_SIZE = 32
+
+# Seconds a list_rooms response is reused by get_room_info
+ROOMS_CACHE_TTL_SECONDS = 0.5
+
+# Health checks report unhealthy if the LiveKit API takes longer than this to answer
+HEALTH_CHECK_TIMEOUT_SECONDS = 1.5
+
+# Published audio is pushed in exact 10 ms frames
+FRAME_DURATION_MS = 10
+
+# Audio the source buffers ahead of playback; a full queue makes capture_frame
+# wait, which paces publishing at real time while keeping added latency small
+AUDIO_SOURCE_QUEUE_MS = 50
+
+# LiveKit audio frames carry interleaved signed 16-bit PCM
+BYTES_PER_SAMPLE = 2
+
+# Request messages without per-call fields are built once and reused
+_LIST_ALL_ROOMS = api.ListRoomsRequest()
+
+
+@lru_cache(maxsize=256)
+def _list_participants_request(room_name: str) -> api.ListParticipantsRequest:
+    """Return a shared ListParticipantsRequest for the room."""
+    return api.ListParticipantsRequest(room=room_name)
+
+
+def _decode_jwt_claims(token: str) -> Dict[str, Any]:
+    """Decode the payload segment of a JWT without verifying its signature."""
+    payload = token.split(".")[1]
+    payload += "=" * (-len(payload) % 4)
+    claims = json.loads(base64.urlsafe_b64decode(payload))
+    if not isinstance(claims, dict):
+        raise ValueError("JWT payload is not a JSON object")
+    return claims
+
 
 class LiveKitError(Exception):
     """Custom LiveKit error with remediation suggestions."""
@@ -39,26 +94,101 @@ class LiveKitManager:
         
         self.room_service = api.RoomService(self.url, self.api_key, self.api_secret)
         self.current_room: Optional[rtc.Room] = None
-        self.participants: Dict[str, rtc.RemoteParticipant] = {}
         self.audio_track: Optional[rtc.LocalAudioTrack] = None
         self.connection_callbacks: Dict[str, Callable] = {}
+        
+        # (token, room_name) -> (is_valid, expires_at epoch seconds), in LRU order
+        self._verified_tokens: OrderedDict[Tuple[str, str], Tuple[bool, float]] = OrderedDict()
+        
+        # (identity, room_name, metadata, ttl_hours) -> (jwt, expires_at), in LRU order
+        self._token_cache: OrderedDict[Tuple[str, str, Optional[str], int], Tuple[str, float]] = OrderedDict()
+        
+        # (fetched_at monotonic seconds, rooms indexed by name); the lock collapses concurrent refreshes
+        self._rooms_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        self._rooms_lock = asyncio.Lock()
+        
+        # Per-track audio reader/dispatcher tasks, cancelled when leaving the room
+        self._track_tasks: Set[asyncio.Task[None]] = set()
+        
+        # Pre-allocated frames for the current (sample_rate, num_channels, samples_per_channel) shape
+        self._frame_pool_shape: Optional[Tuple[int, int, int]] = None
+        self._frame_pool: Deque[rtc.AudioFrame] = deque(maxlen=AUDIO_FRAME_POOL_SIZE)
+    
+    @property
+    def participants(self) -> Mapping[str, rtc.RemoteParticipant]:
+        """Remote participants of the current room, as tracked by the SDK.
+        
+        This is the SDK's live mapping, not a copy; callers must not mutate it.
+        """
+        return self.current_room.remote_participants if self.current_room else {}
     
     async def verify_token(self, token: str, room_name: str) -> bool:
         """Verify LiveKit access token."""
+        cache_key = (token, room_name)
+        cached = self._verified_tokens.get(cache_key)
+        if cached is not None:
+            is_valid, expires_at = cached
+            if time.time() < expires_at:
+                self._verified_tokens.move_to_end(cache_key)
+                return is_valid
+            del self._verified_tokens[cache_key]
+        
+        # Reject tokens granted for another room before doing any signature work
+        claims: Optional[Dict[str, Any]]
+        try:
+            claims = _decode_jwt_claims(token)
+        except Exception:
+            claims = None
+        if claims is not None:
+            video = claims.get("video")
+            if not isinstance(video, dict):
+                return False
+            if video.get("room") != room_name and not video.get("roomAdmin"):
+                return False
+        
         try:
             # Parse and verify the token
             decoded_token = AccessToken.from_jwt(token, self.api_secret)
             
             # Check if token is valid for the room
             grants = decoded_token.video_grants
-            if grants and (grants.room == room_name or grants.room_admin):
-                return True
-            
-            return False
+            is_valid = bool(grants and (grants.room == room_name or grants.room_admin))
             
         except Exception as e:
-            logger.error(f"Token verification failed: {e}")
+            logger.error("Token verification failed: %s", e)
             return False
+        
+        # Cache the decision until the token itself expires
+        if claims is None:
+            return is_valid
+        try:
+            expires_at = float(claims["exp"])
+        except (KeyError, TypeError, ValueError):
+            return is_valid
+        
+        self._verified_tokens[cache_key] = (is_valid, expires_at)
+        if len(self._verified_tokens) > VERIFY_CACHE_SIZE:
+            self._verified_tokens.popitem(last=False)
+        
+        return is_valid
+    
+    def clear_caches(self) -> None:
+        """Drop cached generated tokens, token verification results and room listings."""
+        self._verified_tokens.clear()
+        self._token_cache.clear()
+        self._rooms_cache = None
+    
+    async def _rooms_by_name(self) -> Dict[str, Any]:
+        """List rooms keyed by name, reusing a listing younger than ROOMS_CACHE_TTL_SECONDS."""
+        async with self._rooms_lock:
+            now = time.monotonic()
+            if self._rooms_cache and now - self._rooms_cache[0] < ROOMS_CACHE_TTL_SECONDS:
+                return self._rooms_cache[1]
+            
+            rooms = await self.room_service.list_rooms(_LIST_ALL_ROOMS)
+            by_name = {room.name: room for room in rooms.rooms}
+            self._rooms_cache = (now, by_name)
+            return by_name
     
     def generate_token(
         self, 
@@ -68,17 +198,17 @@ class LiveKitManager:
         ttl_hours: int = 24
     ) -> str:
         """Generate LiveKit access token for participant."""
+        now = time.time()
+        cache_key = (identity, room_name, metadata, ttl_hours)
+        cached = self._token_cache.get(cache_key)
+        if cached is not None:
+            jwt, expires_at = cached
+            if expires_at - now > TOKEN_REUSE_MARGIN_SECONDS:
+                self._token_cache.move_to_end(cache_key)
+                return jwt
+            del self._token_cache[cache_key]
+        
         try:
-            token = AccessToken(self.api_key, self.api_secret)
-            token.identity = identity
-            token.name = identity
-            
-            if metadata:
-                token.metadata = metadata
-            
-            # Set token expiry
-            token.ttl = timedelta(hours=ttl_hours)
-            
             # Grant permissions
             grants = VideoGrants(
                 room_join=True,
@@ -87,16 +217,32 @@ class LiveKitManager:
                 can_subscribe=True,
                 can_publish_data=True
             )
-            token.video_grants = grants
             
-            return token.to_jwt()
+            token = (
+                AccessToken(self.api_key, self.api_secret)
+                .with_identity(identity)
+                .with_name(identity)
+                .with_ttl(timedelta(hours=ttl_hours))
+                .with_grants(grants)
+            )
+            
+            if metadata:
+                token = token.with_metadata(metadata)
+            
+            jwt = token.to_jwt()
             
         except Exception as e:
-            logger.error(f"Token generation failed: {e}")
+            logger.error("Token generation failed: %s", e)
             raise LiveKitError(
                 f"Failed to generate token: {e}",
                 "Check API key and secret configuration"
             )
+        
+        self._token_cache[cache_key] = (jwt, now + ttl_hours * 3600)
+        if len(self._token_cache) > TOKEN_CACHE_SIZE:
+            self._token_cache.popitem(last=False)
+        
+        return jwt
     
     async def create_room(self, room_name: str, max_participants: int = 10) -> Dict[str, Any]:
         """Create a new LiveKit room."""
@@ -105,12 +251,16 @@ class LiveKitManager:
                 name=room_name,
                 max_participants=max_participants,
                 empty_timeout=3600,  # 1 hour
-                metadata='{"agent_room": true, "created_at": "' + datetime.utcnow().isoformat() + '"}'
+                metadata=json.dumps(
+                    {"agent_room": True, "created_at": datetime.utcnow().isoformat()},
+                    separators=(",", ":")
+                )
             )
             
             room_info = await self.room_service.create_room(room_request)
+            self._rooms_cache = None
             
-            logger.info(f"Created room: {room_name}", extra={
+            logger.info("Created room: %s", room_name, extra={
                 "room_name": room_name,
                 "room_sid": room_info.sid
             })
@@ -123,7 +273,7 @@ class LiveKitManager:
             }
             
         except Exception as e:
-            logger.error(f"Room creation failed: {e}")
+            logger.error("Room creation failed: %s", e)
             raise LiveKitError(
                 f"Failed to create room {room_name}: {e}",
                 "Check room name format and API permissions"
@@ -151,7 +301,7 @@ class LiveKitManager:
             
             self.current_room = room
             
-            logger.info(f"Joined room: {room_name}", extra={
+            logger.info("Joined room: %s", room_name, extra={
                 "room_name": room_name,
                 "participant_identity": participant_identity
             })
@@ -159,7 +309,7 @@ class LiveKitManager:
             return room
             
         except Exception as e:
-            logger.error(f"Failed to join room: {e}")
+            logger.error("Failed to join room: %s", e)
             raise LiveKitError(
                 f"Failed to join room {room_name}: {e}",
                 "Check network connectivity and room permissions"
@@ -171,58 +321,181 @@ class LiveKitManager:
             try:
                 await self.current_room.disconnect()
                 self.current_room = None
-                self.participants.clear()
+                
+                for task in list(self._track_tasks):
+                    task.cancel()
                 
                 logger.info("Left LiveKit room")
                 
             except Exception as e:
-                logger.error(f"Error leaving room: {e}")
+                logger.error("Error leaving room: %s", e)
                 raise LiveKitError(
                     f"Failed to leave room: {e}",
                     "Force disconnect may be required"
                 )
     
-    async def publish_audio_track(self, audio_data: bytes, sample_rate: int = 16000) -> None:
-        """Publish audio track to room."""
+    async def publish_audio_track(
+        self,
+        audio_data: bytes,
+        sample_rate: int = 16000,
+        num_channels: int = 1
+    ) -> None:
+        """Publish interleaved 16-bit PCM audio to the room."""
         if not self.current_room:
             raise LiveKitError(
                 "No active room connection",
                 "Join a room before publishing tracks"
             )
         
+        samples_per_channel = self._samples_per_frame(sample_rate)
+        
         try:
-            if not self.audio_track:
-                # Create audio source
-                audio_source = rtc.AudioSource(sample_rate, 1)  # mono
-                self.audio_track = rtc.LocalAudioTrack.create_audio_track(
-                    "agent_audio", audio_source
-                )
-                
-                # Publish track
-                await self.current_room.local_participant.publish_track(
-                    self.audio_track,
-                    rtc.TrackPublishOptions(source=rtc.TrackSource.SOURCE_MICROPHONE)
+            audio_track = await self._ensure_audio_track(self.current_room, sample_rate, num_channels)
+            
+            # Push audio data in 10 ms pooled frames, padding the last one with silence
+            chunk_bytes = samples_per_channel * num_channels * BYTES_PER_SAMPLE
+            audio_view = memoryview(audio_data)
+            
+            for offset in range(0, len(audio_data), chunk_bytes):
+                audio_frame = self._frame_from_chunk(
+                    audio_view[offset:offset + chunk_bytes], sample_rate, num_channels, samples_per_channel
                 )
+                try:
+                    await audio_track.source.capture_frame(audio_frame)
+                finally:
+                    self._release_frame(audio_frame, sample_rate, num_channels, samples_per_channel)
             
-            # Push audio data
-            audio_frame = rtc.AudioFrame(
-                data=audio_data,
-                sample_rate=sample_rate,
-                num_channels=1,
-                samples_per_channel=len(audio_data) // 2  # 16-bit samples
+        except Exception as e:
+            logger.error("Failed to publish audio: %s", e)
+            raise LiveKitError(
+                f"Audio publishing failed: {e}",
+                "Check audio format and track permissions"
             )
+    
+    async def publish_audio_batch(
+        self,
+        chunks: List[bytes],
+        sample_rate: int = 16000,
+        num_channels: int = 1
+    ) -> None:
+        """Publish several 10 ms PCM chunks as one frame with a single capture call.
+        
+        Each chunk must hold at most 10 ms of interleaved 16-bit audio; shorter
+        chunks are padded with silence. The chunks are copied back to back into
+        one pooled frame, so the batch reaches the source in order.
+        """
+        if not self.current_room:
+            raise LiveKitError(
+                "No active room connection",
+                "Join a room before publishing tracks"
+            )
+        
+        samples_per_channel = self._samples_per_frame(sample_rate)
+        if not chunks:
+            return
+        
+        try:
+            audio_track = await self._ensure_audio_track(self.current_room, sample_rate, num_channels)
             
-            await self.audio_track.source.capture_frame(audio_frame)
+            chunk_bytes = samples_per_channel * num_channels * BYTES_PER_SAMPLE
+            if any(len(chunk) > chunk_bytes for chunk in chunks):
+                raise ValueError(f"chunks must be at most {FRAME_DURATION_MS} ms ({chunk_bytes} bytes)")
+            
+            batch_samples = len(chunks) * samples_per_channel
+            audio_frame = self._acquire_frame(sample_rate, num_channels, batch_samples)
+            try:
+                frame_bytes = memoryview(audio_frame.data).cast("B")
+                for index, chunk in enumerate(chunks):
+                    offset = index * chunk_bytes
+                    frame_bytes[offset:offset + len(chunk)] = chunk
+                    frame_bytes[offset + len(chunk):offset + chunk_bytes] = bytes(chunk_bytes - len(chunk))
+                await audio_track.source.capture_frame(audio_frame)
+            finally:
+                self._release_frame(audio_frame, sample_rate, num_channels, batch_samples)
             
         except Exception as e:
-            logger.error(f"Failed to publish audio: {e}")
+            logger.error("Failed to publish audio batch: %s", e)
             raise LiveKitError(
                 f"Audio publishing failed: {e}",
                 "Check audio format and track permissions"
             )
     
-    async def subscribe_to_audio(self, callback: Callable[[bytes], None]) -> None:
-        """Subscribe to audio tracks from participants."""
+    @staticmethod
+    def _samples_per_frame(sample_rate: int) -> int:
+        """Samples per channel in one 10 ms frame; rates that don't divide evenly are rejected."""
+        if sample_rate <= 0 or sample_rate * FRAME_DURATION_MS % 1000:
+            raise LiveKitError(
+                f"Sample rate {sample_rate} Hz does not split into {FRAME_DURATION_MS} ms frames",
+                "Resample to a rate divisible by 100, such as 16000, 24000 or 48000 Hz"
+            )
+        return sample_rate * FRAME_DURATION_MS // 1000
+    
+    async def _ensure_audio_track(
+        self,
+        room: rtc.Room,
+        sample_rate: int,
+        num_channels: int
+    ) -> rtc.LocalAudioTrack:
+        """Return the agent's audio track, creating and publishing it on first use."""
+        if self.audio_track:
+            return self.audio_track
+        
+        # Create audio source
+        audio_source = rtc.AudioSource(sample_rate, num_channels, queue_size_ms=AUDIO_SOURCE_QUEUE_MS)
+        audio_track = rtc.LocalAudioTrack.create_audio_track(
+            "agent_audio", audio_source
+        )
+        self.audio_track = audio_track
+        
+        # Publish track
+        await room.local_participant.publish_track(
+            audio_track,
+            rtc.TrackPublishOptions(source=rtc.TrackSource.SOURCE_MICROPHONE)
+        )
+        return audio_track
+    
+    def _frame_from_chunk(
+        self,
+        chunk: memoryview,
+        sample_rate: int,
+        num_channels: int,
+        samples_per_channel: int
+    ) -> rtc.AudioFrame:
+        """Copy a chunk into a pooled frame, padding any remainder with silence."""
+        audio_frame = self._acquire_frame(sample_rate, num_channels, samples_per_channel)
+        frame_bytes = memoryview(audio_frame.data).cast("B")
+        frame_bytes[:len(chunk)] = chunk
+        if len(chunk) < len(frame_bytes):
+            frame_bytes[len(chunk):] = bytes(len(frame_bytes) - len(chunk))
+        return audio_frame
+    
+    def _acquire_frame(self, sample_rate: int, num_channels: int, samples_per_channel: int) -> rtc.AudioFrame:
+        """Take a frame of the given shape from the pool, allocating if empty."""
+        if self._frame_pool_shape == (sample_rate, num_channels, samples_per_channel) and self._frame_pool:
+            return self._frame_pool.pop()
+        return rtc.AudioFrame.create(sample_rate, num_channels, samples_per_channel)
+    
+    def _release_frame(
+        self,
+        frame: rtc.AudioFrame,
+        sample_rate: int,
+        num_channels: int,
+        samples_per_channel: int
+    ) -> None:
+        """Return a frame to the pool; a new shape replaces the pooled frames."""
+        shape = (sample_rate, num_channels, samples_per_channel)
+        if self._frame_pool_shape != shape:
+            self._frame_pool_shape = shape
+            self._frame_pool.clear()
+        self._frame_pool.append(frame)
+    
+    async def subscribe_to_audio(self, callback: Callable[[np.ndarray], None]) -> None:
+        """Subscribe to audio tracks from participants.
+        
+        The callback receives each frame's PCM samples as an int16 array that
+        shares the frame's buffer; callers that need ``bytes`` should call
+        ``.tobytes()``.
+        """
         if not self.current_room:
             raise LiveKitError(
                 "No active room connection",
@@ -231,53 +504,82 @@ class LiveKitManager:
         
         def on_track_subscribed(track: rtc.Track, publication: rtc.RemoteTrackPublication, participant: rtc.RemoteParticipant):
             if track.kind == rtc.TrackKind.KIND_AUDIO:
-                logger.info(f"Subscribed to audio track from {participant.identity}")
+                logger.info("Subscribed to audio track from %s", participant.identity)
                 
-                # Set up audio frame handler
+                # Read frames into a bounded queue so a slow callback never stalls the stream
                 audio_stream = rtc.AudioStream(track)
+                frames: asyncio.Queue[Optional[np.ndarray]] = asyncio.Queue(maxsize=AUDIO_CALLBACK_QUEUE_SIZE)
                 
-                async def handle_audio_frame():
-                    async for frame in audio_stream:
-                        if callback:
-                            callback(frame.data.tobytes())
+                async def read_audio_frames() -> None:
+                    try:
+                        async for frame in audio_stream:
+                            if frames.full():
+                                frames.get_nowait()  # drop the oldest frame
+                            frames.put_nowait(np.frombuffer(frame.data, dtype=np.int16))
+                    except Exception as e:
+                        logger.error("Audio stream failed for %s: %s", participant.identity, e)
+                        # Wake the dispatcher without waiting on a full backlog
+                        if frames.full():
+                            frames.get_nowait()
+                        frames.put_nowait(None)
+                    else:
+                        await frames.put(None)
                 
-                asyncio.create_task(handle_audio_frame())
+                async def dispatch_audio_frames() -> None:
+                    while (samples := await frames.get()) is not None:
+                        if not callback:
+                            continue
+                        # A failing callback loses only its frame, never the subscription
+                        try:
+                            callback(samples)
+                        except Exception as e:
+                            logger.error("Audio callback failed for %s: %s", participant.identity, e)
+                
+                self._spawn_track_task(read_audio_frames(), f"audio-reader-{participant.identity}")
+                self._spawn_track_task(dispatch_audio_frames(), f"audio-dispatch-{participant.identity}")
         
         self.current_room.on("track_subscribed", on_track_subscribed)
     
+    def _spawn_track_task(self, coro: Coroutine[Any, Any, None], name: str) -> asyncio.Task[None]:
+        """Start a per-track task and keep a reference until it finishes."""
+        task = asyncio.create_task(coro, name=name)
+        self._track_tasks.add(task)
+        task.add_done_callback(self._track_tasks.discard)
+        return task
+    
     def _setup_room_events(self, room: rtc.Room) -> None:
         """Set up room event handlers."""
         
         @room.on("participant_connected")
         def on_participant_connected(participant: rtc.RemoteParticipant):
-            logger.info(f"Participant connected: {participant.identity}")
-            self.participants[participant.identity] = participant
+            logger.info("Participant connected: %s", participant.identity)
             
-            if "participant_connected" in self.connection_callbacks:
-                self.connection_callbacks["participant_connected"](participant)
+            callback = self.connection_callbacks.get("participant_connected")
+            if callback:
+                callback(participant)
         
         @room.on("participant_disconnected")  
         def on_participant_disconnected(participant: rtc.RemoteParticipant):
-            logger.info(f"Participant disconnected: {participant.identity}")
-            if participant.identity in self.participants:
-                del self.participants[participant.identity]
+            logger.info("Participant disconnected: %s", participant.identity)
             
-            if "participant_disconnected" in self.connection_callbacks:
-                self.connection_callbacks["participant_disconnected"](participant)
+            callback = self.connection_callbacks.get("participant_disconnected")
+            if callback:
+                callback(participant)
         
         @room.on("track_published")
         def on_track_published(publication: rtc.RemoteTrackPublication, participant: rtc.RemoteParticipant):
-            logger.info(f"Track published by {participant.identity}: {publication.sid}")
+            logger.info("Track published by %s: %s", participant.identity, publication.sid)
         
         @room.on("track_unpublished")
         def on_track_unpublished(publication: rtc.RemoteTrackPublication, participant: rtc.RemoteParticipant):
-            logger.info(f"Track unpublished by {participant.identity}: {publication.sid}")
+            logger.info("Track unpublished by %s: %s", participant.identity, publication.sid)
         
         @room.on("disconnected")
         def on_disconnected():
             logger.warning("Disconnected from room")
-            if "disconnected" in self.connection_callbacks:
-                self.connection_callbacks["disconnected"]()
+            callback = self.connection_callbacks.get("disconnected")
+            if callback:
+                callback()
     
     def register_callback(self, event: str, callback: Callable) -> None:
         """Register callback for connection events."""
@@ -286,25 +588,24 @@ class LiveKitManager:
     async def get_room_info(self, room_name: str) -> Dict[str, Any]:
         """Get information about a room."""
         try:
-            rooms = await self.room_service.list_rooms(api.ListRoomsRequest())
-            
-            for room in rooms.rooms:
-                if room.name == room_name:
-                    return {
-                        "name": room.name,
-                        "sid": room.sid,
-                        "num_participants": room.num_participants,
-                        "creation_time": room.creation_time,
-                        "metadata": room.metadata
-                    }
+            room = (await self._rooms_by_name()).get(room_name)
             
-            raise LiveKitError(
-                f"Room {room_name} not found",
-                "Create the room first or check room name"
-            )
+            if room is None:
+                raise LiveKitError(
+                    f"Room {room_name} not found",
+                    "Create the room first or check room name"
+                )
+            
+            return {
+                "name": room.name,
+                "sid": room.sid,
+                "num_participants": room.num_participants,
+                "creation_time": room.creation_time,
+                "metadata": room.metadata
+            }
             
         except Exception as e:
-            logger.error(f"Failed to get room info: {e}")
+            logger.error("Failed to get room info: %s", e)
             raise LiveKitError(
                 f"Failed to get room info: {e}",
                 "Check API permissions and room existence"
@@ -314,7 +615,7 @@ class LiveKitManager:
         """List participants in a room."""
         try:
             participants = await self.room_service.list_participants(
-                api.ListParticipantsRequest(room=room_name)
+                _list_participants_request(room_name)
             )
             
             return [
@@ -329,7 +630,7 @@ class LiveKitManager:
             ]
             
         except Exception as e:
-            logger.error(f"Failed to list participants: {e}")
+            logger.error("Failed to list participants: %s", e)
             raise LiveKitError(
                 f"Failed to list participants: {e}",
                 "Check room name and API permissions"
@@ -337,24 +638,35 @@ class LiveKitManager:
     
     async def health_check(self) -> Dict[str, Any]:
         """Perform LiveKit service health check."""
+        started = time.monotonic()
         try:
-            # Try to list rooms as a connectivity test
-            await self.room_service.list_rooms(api.ListRoomsRequest())
+            # List rooms as a connectivity test, bypassing the cache so the API itself is probed
+            rooms = await asyncio.wait_for(
+                self.room_service.list_rooms(_LIST_ALL_ROOMS), timeout=HEALTH_CHECK_TIMEOUT_SECONDS
+            )
+            latency_ms = round((time.monotonic() - started) * 1000, 1)
+            self._rooms_cache = (time.monotonic(), {room.name: room for room in rooms.rooms})
             
             return {
                 "status": "healthy",
                 "url": self.url,
                 "timestamp": datetime.utcnow().isoformat(),
-                "connected": self.current_room is not None
+                "connected": self.current_room is not None,
+                "latency_ms": latency_ms
             }
             
+        except TimeoutError:
+            error = f"LiveKit API did not respond within {HEALTH_CHECK_TIMEOUT_SECONDS}s"
         except Exception as e:
-            logger.error(f"Health check failed: {e}")
-            return {
-                "status": "unhealthy",
-                "error": str(e),
-                "url": self.url,
-                "timestamp": datetime.utcnow().isoformat(),
-                "connected": False,
-                "remediation": "Check LiveKit server status and network connectivity"
-            }
\ No newline at end of file
+            error = str(e)
+        
+        logger.error("Health check failed: %s", error)
+        return {
+            "status": "unhealthy",
+            "error": error,
+            "url": self.url,
+            "timestamp": datetime.utcnow().isoformat(),
+            "connected": False,
+            "latency_ms": round((time.monotonic() - started) * 1000, 1),
+            "remediation": "Check LiveKit server status and network connectivity"
+        }
@@ -5,12 +5,15 @@ Provides LangChain-compatible memory interface with session-scoped context.
 
 import asyncio
 import logging
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, List, Optional, Tuple, Union
+from collections import OrderedDict
 from datetime import datetime
-import json
 import os
+import threading
 from pathlib import Path
 
+import orjson
+
 try:
     from mem0 import Memory
     MEM0_AVAILABLE = True
@@ -22,6 +25,30 @@ from langchain.schema import BaseMessage, HumanMessage, AIMessage
 
 logger = logging.getLogger(__name__)
 
+# Process-wide pool of Mem0 clients keyed by API key, so every Mem0Memory
+# sharing credentials reuses one client instead of re-handshaking.
+_CLIENT_POOL: Dict[str, Any] = {}
+_CLIENT_POOL_LOCK = threading.Lock()
+
+# Parsed sessions kept in memory by each LocalMemoryStore
+SESSION_CACHE_SIZE = 128
+
+# Session log records are compact JSON; non-string keys are stringified like the stdlib encoder does
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+# Session logs are rewritten without deleted entries once they hold this many tombstones
+COMPACT_TOMBSTONE_THRESHOLD = 64
+
+
+def _get_pooled_client(api_key: str) -> Any:
+    """Get or create the shared Mem0 client for an API key."""
+    with _CLIENT_POOL_LOCK:
+        client = _CLIENT_POOL.get(api_key)
+        if client is None:
+            client = Memory(api_key=api_key)
+            _CLIENT_POOL[api_key] = client
+        return client
+
 
 class MemoryError(Exception):
     """Custom memory error with remediation suggestions."""
@@ -32,27 +59,137 @@ class MemoryError(Exception):
 
 
 class LocalMemoryStore:
-    """Local filesystem-based memory store fallback."""
+    """Local filesystem-based memory store fallback.
+    
+    Each session is an append-only JSON Lines log: one memory entry per line,
+    with deletions recorded as ``{"_tombstone": id}`` lines. The log is
+    compacted once it carries more than COMPACT_TOMBSTONE_THRESHOLD tombstones.
+    """
     
     def __init__(self, storage_path: str = "./memory_store"):
         self.storage_path = Path(storage_path)
         self.storage_path.mkdir(parents=True, exist_ok=True)
         
+        # (project, session_id) -> ((mtime_ns, size), memories, tombstones), in LRU order
+        self._cache: OrderedDict[Tuple[str, str], Tuple[Tuple[int, int], List[Dict[str, Any]], int]] = OrderedDict()
+        self._cache_lock = threading.Lock()
+    
     def _get_session_file(self, project: str, session_id: str) -> Path:
-        """Get file path for session memory."""
+        """Get file path for session memory, converting a legacy JSON file if present."""
         project_dir = self.storage_path / project
         project_dir.mkdir(exist_ok=True)
-        return project_dir / f"{session_id}.json"
+        session_file = project_dir / f"{session_id}.jsonl"
+        
+        legacy_file = project_dir / f"{session_id}.json"
+        if not session_file.exists() and legacy_file.exists():
+            memories = orjson.loads(legacy_file.read_bytes()).get('memories', [])
+            self._write_log(session_file, memories)
+            legacy_file.unlink()
+        
+        return session_file
+    
+    @staticmethod
+    def _file_version(session_file: Path) -> Optional[Tuple[int, int]]:
+        """Return (mtime_ns, size) identifying the file's current contents, or None if missing."""
+        try:
+            stat = session_file.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+    
+    def _load_session(
+        self, key: Tuple[str, str], session_file: Path
+    ) -> Optional[Tuple[List[Dict[str, Any]], int]]:
+        """Return a session's live memories and tombstone count, parsing the log only if it changed.
+        
+        Callers must hold ``_cache_lock``.
+        """
+        version = self._file_version(session_file)
+        if version is None:
+            self._cache.pop(key, None)
+            return None
+        
+        cached = self._cache.get(key)
+        if cached is not None and cached[0] == version:
+            self._cache.move_to_end(key)
+            return cached[1], cached[2]
+        
+        memories, tombstones = self._read_log(session_file)
+        self._store_session(key, version, memories, tombstones)
+        return memories, tombstones
+    
+    def _store_session(
+        self,
+        key: Tuple[str, str],
+        version: Optional[Tuple[int, int]],
+        memories: List[Dict[str, Any]],
+        tombstones: int
+    ) -> None:
+        """Cache a session's parsed state, evicting the least recently used session past the cap."""
+        if version is None:
+            self._cache.pop(key, None)
+            return
+        self._cache[key] = (version, memories, tombstones)
+        self._cache.move_to_end(key)
+        if len(self._cache) > SESSION_CACHE_SIZE:
+            self._cache.popitem(last=False)
+    
+    @staticmethod
+    def _read_log(session_file: Path) -> Tuple[List[Dict[str, Any]], int]:
+        """Replay a session log into its live memories and the number of tombstones."""
+        live: Dict[str, Dict[str, Any]] = {}
+        tombstones = 0
+        with open(session_file, 'rb') as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    record = orjson.loads(line)
+                except ValueError:
+                    # A write interrupted mid-line leaves a fragment; skip it rather than losing the session
+                    logger.warning(f"Skipping unreadable line {line_number} in {session_file}")
+                    continue
+                if '_tombstone' in record:
+                    live.pop(record['_tombstone'], None)
+                    tombstones += 1
+                else:
+                    live[record['id']] = record
+        return list(live.values()), tombstones
+    
+    @staticmethod
+    def _append_lines(session_file: Path, records: List[Dict[str, Any]]) -> int:
+        """Append records to a session log with a single O_APPEND write.
+        
+        Returns the size the log had just before this write, so callers can tell
+        whether another writer appended since they last read it.
+        """
+        payload = b"".join(orjson.dumps(record, option=_ORJSON_OPTIONS) + b"\n" for record in records)
+        fd = os.open(session_file, os.O_RDWR | os.O_CREAT | os.O_APPEND, 0o644)
+        try:
+            # Start on a fresh line if an earlier write was torn before its newline
+            size = os.fstat(fd).st_size
+            if size and os.pread(fd, 1, size - 1) != b"\n":
+                payload = b"\n" + payload
+            os.write(fd, payload)
+        finally:
+            os.close(fd)
+        return size
+    
+    @staticmethod
+    def _write_log(session_file: Path, memories: List[Dict[str, Any]]) -> None:
+        """Atomically replace a session log with just the given memories."""
+        tmp_file = session_file.with_suffix(".jsonl.tmp")
+        with open(tmp_file, 'wb') as f:
+            f.writelines(orjson.dumps(mem, option=_ORJSON_OPTIONS) + b"\n" for mem in memories)
+        os.replace(tmp_file, session_file)
     
     def get_memories(self, project: str, session_id: str) -> List[Dict[str, Any]]:
         """Get memories for a session."""
         try:
             session_file = self._get_session_file(project, session_id)
-            if session_file.exists():
-                with open(session_file, 'r') as f:
-                    data = json.load(f)
-                    return data.get('memories', [])
-            return []
+            with self._cache_lock:
+                loaded = self._load_session((project, session_id), session_file)
+            return list(loaded[0]) if loaded else []
         except Exception as e:
             logger.error(f"Failed to load memories: {e}")
             return []
@@ -62,15 +199,8 @@ class LocalMemoryStore:
         try:
             session_file = self._get_session_file(project, session_id)
             
-            # Load existing memories
-            if session_file.exists():
-                with open(session_file, 'r') as f:
-                    data = json.load(f)
-            else:
-                data = {'memories': [], 'metadata': {}}
-            
             # Add new memory with ID and timestamp
-            memory_id = f"mem_{datetime.now().timestamp()}_{len(data['memories'])}"
+            memory_id = f"mem_{datetime.now().timestamp()}_{os.urandom(4).hex()}"
             memory_entry = {
                 'id': memory_id,
                 'content': memory,
@@ -78,13 +208,22 @@ class LocalMemoryStore:
                 'session_id': session_id
             }
             
-            data['memories'].append(memory_entry)
-            data['metadata']['last_updated'] = datetime.utcnow().isoformat()
-            data['metadata']['total_memories'] = len(data['memories'])
-            
-            # Save updated memories
-            with open(session_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            key = (project, session_id)
+            with self._cache_lock:
+                cached = self._cache.get(key)
+                if cached is not None and cached[0] != self._file_version(session_file):
+                    cached = None
+                
+                size_before = self._append_lines(session_file, [memory_entry])
+                
+                # Extend an up-to-date cached session instead of re-parsing it on the next read,
+                # unless another writer appended between the version check and this write
+                if cached is not None and cached[0][1] == size_before:
+                    _, memories, tombstones = cached
+                    memories.append(memory_entry)
+                    self._store_session(key, self._file_version(session_file), memories, tombstones)
+                else:
+                    self._cache.pop(key, None)
             
             logger.debug(f"Added memory {memory_id} to session {session_id}")
             return memory_id
@@ -117,27 +256,36 @@ class LocalMemoryStore:
         """Delete specific memories."""
         try:
             session_file = self._get_session_file(project, session_id)
-            if not session_file.exists():
-                return 0
-            
-            with open(session_file, 'r') as f:
-                data = json.load(f)
-            
-            # Filter out deleted memories
-            original_count = len(data['memories'])
-            data['memories'] = [
-                mem for mem in data['memories'] 
-                if mem.get('id') not in memory_ids
-            ]
+            key = (project, session_id)
             
-            deleted_count = original_count - len(data['memories'])
-            data['metadata']['last_updated'] = datetime.utcnow().isoformat()
-            data['metadata']['total_memories'] = len(data['memories'])
-            
-            with open(session_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            with self._cache_lock:
+                loaded = self._load_session(key, session_file)
+                if loaded is None:
+                    return 0
+                memories, tombstones = loaded
+                cached_size = self._cache[key][0][1]
+                
+                # Tombstone only the memories that are still live
+                delete_ids = set(memory_ids)
+                deleted = [mem['id'] for mem in memories if mem['id'] in delete_ids]
+                if not deleted:
+                    return 0
+                
+                remaining = [mem for mem in memories if mem['id'] not in delete_ids]
+                if tombstones + len(deleted) > COMPACT_TOMBSTONE_THRESHOLD:
+                    self._write_log(session_file, remaining)
+                    tombstones = 0
+                else:
+                    size_before = self._append_lines(session_file, [{'_tombstone': mem_id} for mem_id in deleted])
+                    tombstones += len(deleted)
+                    if size_before != cached_size:
+                        # Another writer appended in between; re-parse on the next read
+                        self._cache.pop(key, None)
+                        return len(deleted)
+                
+                self._store_session(key, self._file_version(session_file), remaining, tombstones)
             
-            return deleted_count
+            return len(deleted)
             
         except Exception as e:
             logger.error(f"Failed to delete memories: {e}")
@@ -156,7 +304,7 @@ class Mem0Memory:
         # Initialize Mem0 client or fallback
         if MEM0_AVAILABLE and self.store_type == "remote" and self.api_key:
             try:
-                self.mem0_client = Memory(api_key=self.api_key)
+                self.mem0_client = _get_pooled_client(self.api_key)
                 self.mem0_available = True
                 logger.info("Initialized Mem0 remote client")
             except Exception as e: